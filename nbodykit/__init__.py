@@ -16,10 +16,26 @@ except:
     dask.set_options(get=dask.get)
 
 _global_options = {}
-_global_options['global_cache_size'] = 1e8 # 100 MB
-_global_options['dask_chunk_size'] = 100000
+_global_options['global_cache_size'] = 1e9 # 1 GB
+_global_options['dask_chunk_size'] = None # None means size from dask_chunk_bytes
+_global_options['dask_chunk_bytes'] = 64 * 1024 * 1024 # 64 MB
 _global_options['paint_chunk_size'] = 1024 * 1024 * 4
 
+def _default_chunk_size(rowsize=8):
+    """
+    The default dask chunk size, in rows, for an array whose rows
+    occupy ``rowsize`` bytes.
+
+    If the ``dask_chunk_size`` global option is set, it is always used;
+    otherwise, the number of rows is chosen such that a single chunk
+    occupies roughly ``dask_chunk_bytes`` bytes, so neither very large
+    nor very small catalogs produce a pathological number of chunks.
+    See :class:`set_options`.
+    """
+    if _global_options['dask_chunk_size'] is not None:
+        return _global_options['dask_chunk_size']
+    return max(1, int(_global_options['dask_chunk_bytes']) // max(1, int(rowsize)))
+
 from contextlib import contextmanager
 import logging
 
@@ -195,6 +211,8 @@ class GlobalCache(dask.cache.Cache):
         A Cache object.
     """
 
+    _instance = None
+
     @classmethod
     def get(cls):
         """
@@ -206,11 +224,12 @@ class GlobalCache(dask.cache.Cache):
         cache : :class:`dask.cache.Cache`
             the cache object, as provided by dask
         """
-        # if not created, use default cache size
-        return _global_cache
-
-_global_cache = GlobalCache(_global_options['global_cache_size'])
-_global_cache.register()
+        # create and register the cache on first use, so importing
+        # nbodykit does not pay for it
+        if cls._instance is None:
+            cls._instance = cls(_global_options['global_cache_size'])
+            cls._instance.register()
+        return cls._instance
 
 class set_options(object):
     """
@@ -218,9 +237,14 @@ class set_options(object):
 
     Parameters
     ----------
-    dask_chunk_size : int
-        the number of elements for the default chunk size for dask arrays;
-        chunks should usually hold between 10 MB and 100 MB
+    dask_chunk_size : int, optional
+        the number of rows for the default chunk size for dask arrays;
+        if None (the default), the chunk size is computed from
+        ``dask_chunk_bytes`` and the row width of each array
+    dask_chunk_bytes : float
+        the target number of bytes held by a single dask array chunk,
+        used when ``dask_chunk_size`` is None; chunks should usually
+        hold between 10 MB and 100 MB
     global_cache_size : float
         the size of the internal dask cache in bytes; default is 1e9
     paint_chunk_size : int
@@ -249,11 +273,12 @@ class set_options(object):
         _global_options.clear()
         _global_options.update(self.old)
 
-        # resize Cache to original size
+        # resize Cache to original size, if it has been created
         # FIXME: after https://github.com/dask/cachey/pull/12
-        cache = GlobalCache.get().cache
-        cache.available_bytes = _global_options['global_cache_size']
-        cache.shrink()
+        if GlobalCache._instance is not None:
+            cache = GlobalCache.get().cache
+            cache.available_bytes = _global_options['global_cache_size']
+            cache.shrink()
 
 _logging_handler = None
 def setup_logging(log_level="info"):
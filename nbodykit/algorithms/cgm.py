@@ -7,6 +7,7 @@ from six import string_types
 import warnings
 
 from nbodykit import CurrentMPIComm
+from nbodykit.utils import cast_vector
 from nbodykit.source.catalog import ArrayCatalog
 
 class CylindricalGroups(object):
@@ -76,11 +77,10 @@ class CylindricalGroups(object):
         self.attrs = {}
 
         # need BoxSize
-        self.attrs['BoxSize'] = numpy.empty(3)
         BoxSize = source.attrs.get('BoxSize', BoxSize)
         if periodic and BoxSize is None:
             raise ValueError("please specify a BoxSize if using periodic boundary conditions")
-        self.attrs['BoxSize'][:] = BoxSize
+        self.attrs['BoxSize'] = cast_vector(BoxSize)
 
         # LOS must be unit vector
         if flat_sky_los is not None:
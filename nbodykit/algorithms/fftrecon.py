@@ -7,6 +7,7 @@ from nbodykit import CurrentMPIComm
 from nbodykit.base.mesh import MeshSource
 from nbodykit.base.catalog import CatalogSource
 from nbodykit import _global_options
+from nbodykit.utils import cast_vector
 
 class FFTRecon(MeshSource):
     """
@@ -88,8 +89,7 @@ class FFTRecon(MeshSource):
 
         if Nmesh is None:
             Nmesh = data.attrs['Nmesh']
-        _Nmesh = numpy.empty(3, dtype='i8')
-        _Nmesh[...] = Nmesh
+        _Nmesh = cast_vector(Nmesh, dtype='i8')
 
         if BoxSize is None:
             BoxSize = data.attrs['BoxSize']
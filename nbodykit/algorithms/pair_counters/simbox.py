@@ -246,11 +246,10 @@ def shift_to_box_center(pos, BoxSize, comm):
     pos : dask array
         the position array, shifted such that observer is in the box center
     """
-    from nbodykit.utils import get_data_bounds
+    from nbodykit.utils import get_data_bounds, cast_vector
 
     # make BoxSize is a 3-vector
-    _BoxSize = numpy.empty(3)
-    _BoxSize[:] = BoxSize
+    _BoxSize = cast_vector(BoxSize)
 
     # get min/max of position (3-vectors)
     pos_min, pos_max = get_data_bounds(pos, comm)
@@ -1,7 +1,6 @@
-from nbodykit.transform import ConstantArray
-from nbodykit import _global_options, CurrentMPIComm
+from nbodykit import _default_chunk_size, CurrentMPIComm
 
-from six import string_types, add_metaclass
+from six import string_types, with_metaclass
 import numpy
 import logging
 import warnings
@@ -9,6 +8,10 @@ import abc
 import inspect
 import dask.array as da
 
+# whether this dask version carries meta arrays; probed once at import
+# instead of per column access
+_dask_has_meta = hasattr(da.Array, '_meta')
+
 class ColumnAccessor(da.Array):
     """
     Provides access to a Column from a Catalog.
@@ -34,18 +37,44 @@ class ColumnAccessor(da.Array):
         serialized to disk, as they are automatically available as columns
 
     """
+    # accessors are created on every column access, so avoid carrying a
+    # per-instance __dict__; dask's Array declares __slots__ as well
+    __slots__ = ('catalog', 'is_default', '_attrs')
+
     def __new__(cls, catalog, daskarray, is_default=False):
+        # share the graph and meta-data of the wrapped array by reference;
+        # passing the existing meta through (when dask supports it) avoids
+        # re-inferring it from the dtype on every wrap
+        if _dask_has_meta:
+            kwargs = {'meta': daskarray._meta}
+        else:
+            kwargs = {'dtype': daskarray.dtype}
         self = da.Array.__new__(ColumnAccessor,
                 dask=daskarray.dask,
                 name=daskarray.name,
                 chunks=daskarray.chunks,
-                dtype=daskarray.dtype,
-                shape=daskarray.shape)
+                shape=daskarray.shape,
+                **kwargs)
         self.catalog = catalog
         self.is_default = is_default
-        self.attrs = {}
         return self
 
+    @property
+    def attrs(self):
+        """
+        A dict storing the meta-data of the column; it is created lazily,
+        since most accessors never record any meta-data.
+        """
+        try:
+            return self._attrs
+        except AttributeError:
+            self._attrs = {}
+            return self._attrs
+
+    @attrs.setter
+    def attrs(self, value):
+        self._attrs = value
+
     def __getitem__(self, key):
 
         # compute dask index b/c they are not fully supported
@@ -57,7 +86,8 @@ class ColumnAccessor(da.Array):
 
         # return a ColumnAccessor (okay b/c __setitem__ checks for circular references)
         toret = ColumnAccessor(self.catalog, d)
-        toret.attrs.update(self.attrs)
+        if getattr(self, '_attrs', None):
+            toret.attrs.update(self._attrs)
         return toret
 
     def as_daskarray(self):
@@ -76,11 +106,21 @@ class ColumnAccessor(da.Array):
         .. note::
 
             The dask default optimizer induces too many (unnecesarry)
-            IO calls. We turn this feature off by default, and only apply a culling.
+            IO calls. We turn this feature off by default, and only apply
+            culling and linear task fusion.
 
         """
-        from dask.optimization import cull
+        from dask.optimization import cull, fuse
         dsk2, dependencies = cull(dsk, keys)
+
+        # fuse linear chains of tasks into one task; unlike the default
+        # optimizer this never rewrites the IO calls at the graph leaves
+        try:
+            dsk2, dependencies = fuse(dsk2, keys, dependencies=dependencies)
+        except TypeError:
+            # older dask neither accepts nor returns the dependencies
+            dsk2 = fuse(dsk2, keys)
+
         return dsk2
 
     def compute(self):
@@ -88,10 +128,12 @@ class ColumnAccessor(da.Array):
 
     def __str__(self):
         r = da.Array.__str__(self)
-        if len(self) > 0:
-            r = r + " first: %s" % str(self[0].compute())
         if len(self) > 1:
-            r = r + " last: %s" % str(self[-1].compute())
+            # compute the two elements in one pass; shared tasks run once
+            first, last = self.catalog.compute(self[0], self[-1])
+            r = r + " first: %s last: %s" % (str(first), str(last))
+        elif len(self) > 0:
+            r = r + " first: %s" % str(self[0].compute())
         return r
 
 def column(name=None, is_default=False):
@@ -136,6 +178,11 @@ class ColumnFinder(abc.ABCMeta):
 
     2. ``_hardcolumns`` : non-default, hard-coded columns
 
+    3. ``_column_getters`` : a dict mapping column name to the member
+    function implementing the column; this is built once per class so
+    column lookup does not need to re-walk the class hierarchy on
+    every access.
+
     .. note::
 
         This is a subclass of :class:`abc.ABCMeta` so subclasses can
@@ -144,28 +191,22 @@ class ColumnFinder(abc.ABCMeta):
     """
     def __init__(cls, clsname, bases, attrs):
 
-        # attach the registry attributes
-        cls._defaults = set()
-        cls._hardcolumns = set()
-
-        # loop over class and its bases
-        classes = inspect.getmro(cls)
-        for c in reversed(classes):
-
-            # loop over each attribute
-            for name in c.__dict__:
-                value = c.__dict__[name]
-
-                # if it's member function implementing a column,
-                # record it and check if its a default
-                if getattr(value, 'column_name', None):
-                    if value.is_default:
-                        cls._defaults.add(value.column_name)
-                    else:
-                        cls._hardcolumns.add(value.column_name)
-
-@add_metaclass(ColumnFinder)
-class CatalogSourceBase(object):
+        # collect the member functions implementing columns, walking the
+        # MRO once from base to derived class so subclasses override the
+        # columns of their bases
+        getters = {}
+        for c in reversed(inspect.getmro(cls)):
+            getters.update((value.column_name, value)
+                           for value in c.__dict__.values()
+                           if getattr(value, 'column_name', None))
+
+        # attach the registry attributes, classifying each column by the
+        # getter that finally implements it
+        cls._column_getters = getters
+        cls._defaults = set(name for name in getters if getters[name].is_default)
+        cls._hardcolumns = set(name for name in getters if not getters[name].is_default)
+
+class CatalogSourceBase(with_metaclass(ColumnFinder, object)):
     """
     An abstract base class that implements most of the functionality in
     :class:`CatalogSource`.
@@ -196,8 +237,9 @@ class CatalogSourceBase(object):
         :class:`dask.array.Array`.
 
         .. note::
-            The dask array chunk size is controlled via the ``dask_chunk_size``
-            global option. See :class:`~nbodykit.set_options`.
+            The dask array chunk size is controlled via the
+            ``dask_chunk_size`` and ``dask_chunk_bytes`` global options.
+            See :class:`~nbodykit.set_options`.
 
         Parameters
         ----------
@@ -217,7 +259,12 @@ class CatalogSourceBase(object):
             # references
             return array.as_daskarray()
         else:
-            return da.from_array(array, chunks=_global_options['dask_chunk_size'])
+            if not hasattr(array, 'dtype'):
+                array = numpy.asarray(array)
+
+            # chunk in the first dimension only, based on the row width
+            rowsize = array.dtype.itemsize * numpy.prod(array.shape[1:], dtype='intp')
+            return da.from_array(array, chunks=_default_chunk_size(rowsize))
 
     @staticmethod
     def create_instance(cls, comm):
@@ -231,6 +278,14 @@ class CatalogSourceBase(object):
         # user-provided overrides and defaults for columns
         self._overrides = {}
 
+        # cache of the ColumnAccessor objects returned by __getitem__;
+        # entries are evicted when a column is overridden or deleted
+        self._column_cache = {}
+
+        # cached, sorted list of all column names; invalidated whenever
+        # a column is added or deleted
+        self._columns_list = None
+
         # stores memory owner
         self.base = None
 
@@ -258,8 +313,8 @@ class CatalogSourceBase(object):
         """
         if isinstance(other, CatalogSourceBase):
             d = other.__dict__.copy()
-            nocopy = ['base', '_overrides', '_hardcolumns', '_defaults', 'comm',
-                      '_size', '_csize']
+            nocopy = ['base', '_overrides', '_column_cache', '_columns_list',
+                      '_hardcolumns', '_defaults', 'comm', '_size', '_csize']
             for key in d:
                 if key not in nocopy:
                     self.__dict__[key] = d[key]
@@ -270,6 +325,15 @@ class CatalogSourceBase(object):
         return iter(self.columns)
 
     def __contains__(self, col):
+        if self.base is not None: return col in self.base
+
+        # fast paths: check the per-instance and per-class registries
+        # directly, without assembling the sorted column list
+        if col in self._overrides or col in self._defaults or col in self._hardcolumns:
+            return True
+
+        # fall back for subclasses that define extra columns by
+        # overriding the hardcolumns/columns properties
         return col in self.columns
 
     def _get_slice(self, index):
@@ -292,28 +356,51 @@ class CatalogSourceBase(object):
             # from https://stackoverflow.com/a/36188683
             size = max(0, (stop - start + (step - (1 if step > 0 else -1))) // step)
         else:
-            # compute the index slice if needed and get the size
-            index = CatalogSourceBase.make_column(index)
-
-            if index.dtype == numpy.dtype('?'):
-                # verify the index is a boolean array
-                if len(index) != self.size:
-                    raise KeyError("slice index has length %d; should be %d" %(len(index), self.size))
-
-                # new size is just number of True entries
-                size = index.sum().compute()
+            # non-dask indices can be applied to the dask columns directly
+            # as numpy arrays; this avoids wrapping the index itself into
+            # a chunked dask graph per column
+            if not isinstance(index, da.Array):
+                index = numpy.asarray(index)
+
+            if numpy.issubdtype(index.dtype, numpy.bool_):
+                # verify the index is a boolean array; a dask index with
+                # unknown chunk sizes cannot be checked without computing,
+                # so the check is skipped in that case
+                n = index.shape[0]
+                if not numpy.isnan(n) and n != self.size:
+                    raise KeyError("slice index has length %d; should be %d" %(n, self.size))
+
+                # materialize the mask a single time (it is needed to count
+                # the selected size anyways) and reduce it to the selected
+                # row indices, so that indexing each column does not
+                # re-evaluate the mask
+                if isinstance(index, da.Array):
+                    index = self.compute(index)
+                    # the true length is known once computed, so validate
+                    # the masks that were skipped above
+                    if len(index) != self.size:
+                        raise KeyError("slice index has length %d; should be %d" %(len(index), self.size))
+                index = numpy.flatnonzero(index)
+                size = len(index)
             else:
 
-                if len(index) > 0 and index.dtype != numpy.integer:
+                if len(index) > 0 and not numpy.issubdtype(index.dtype, numpy.integer):
                     raise KeyError("slice index has must be boolean, integer. got %s" %(index.dtype))
 
+                # dask routes intp arrays through fancy indexing, keeping
+                # the selection lazy without an intermediate boolean mask
+                if not isinstance(index, da.Array):
+                    index = index.astype(numpy.intp, copy=False)
+
                 size = len(index)
 
         # initialize subset Source of right size
         subset_data = {col:self[col][index] for col in self if not self[col].is_default}
-        if size <= 0.51 * self.size:
+        if isinstance(index, slice) and size <= 0.51 * self.size:
             # if the subsample ratio is substential, then always make
-            # a copy to decouple from the original data
+            # a copy to decouple from the original data; this is only
+            # needed for basic slices -- fancy indexing with an array of
+            # row indices already produces a copy at compute time
             subset_data = {col:subset_data[col].map_blocks(numpy.copy) for col in subset_data}
 
         cls = self.__class__ if self.base is None else self.base.__class__
@@ -349,8 +436,12 @@ class CatalogSourceBase(object):
             if getattr(self, 'size', NotImplemented) is NotImplemented:
                 raise ValueError("cannot perform selection due to NotImplemented size")
 
-            # convert slices to boolean arrays
-            if isinstance(sel, (list, da.Array, numpy.ndarray)):
+            # column names are passed as a list or a numpy string array;
+            # only dask arrays must avoid the check below, since calling
+            # len() on them fails for unknown chunk sizes
+            if isinstance(sel, numpy.ndarray) and sel.dtype.kind in 'US':
+                sel = sel.tolist()
+            if isinstance(sel, list):
 
                 # select a subset of list of string column names
                 if len(sel) > 0 and all(isinstance(ss, string_types) for ss in sel):
@@ -370,6 +461,11 @@ class CatalogSourceBase(object):
         else:
             # owner of the memory (either self or base)
             if self.base is None:
+                # return the cached accessor, if it exists
+                cached = self._column_cache.get(sel, None)
+                if cached is not None:
+                    return cached
+
                 # get the right column
                 is_default = False
                 if sel in self._overrides:
@@ -377,13 +473,15 @@ class CatalogSourceBase(object):
                 elif sel in self.hardcolumns:
                     r = self.get_hardcolumn(sel)
                 elif sel in self._defaults:
-                    r = getattr(self, sel)()
+                    r = self._column_getters[sel](self)
                     is_default = True
                 else:
                     raise KeyError("column `%s` is not defined in this source; " %sel + \
                                     "try adding column via `source[column] = data`")
                 # return a ColumnAccessor for pretty prints
-                return ColumnAccessor(self, r, is_default=is_default)
+                toret = ColumnAccessor(self, r, is_default=is_default)
+                self._column_cache[sel] = toret
+                return toret
             else:
                 # chain to the memory owner
                 # this will not work if there are overrides
@@ -401,6 +499,8 @@ class CatalogSourceBase(object):
         """
         if self.base is not None: return self.base.__setitem__(col, value)
 
+        self._column_cache.pop(col, None)
+        self._columns_list = None
         self._overrides[col] = self.make_column(value)
 
     def __delitem__(self, col):
@@ -421,6 +521,8 @@ class CatalogSourceBase(object):
 
         if col in self._overrides:
             del self._overrides[col]
+            self._column_cache.pop(col, None)
+            self._columns_list = None
             return
 
         raise ValueError("unable to delete column '%s' from CatalogSource" %col)
@@ -467,9 +569,13 @@ class CatalogSourceBase(object):
         """
         if self.base is not None: return self.base.columns
 
-        overrides = list(self._overrides)
-        defaults = list(self._defaults)
-        return sorted(set(self.hardcolumns + overrides + defaults))
+        if self._columns_list is None:
+            overrides = list(self._overrides)
+            defaults = list(self._defaults)
+            self._columns_list = sorted(set(self.hardcolumns + overrides + defaults))
+
+        # return a copy, so callers cannot mutate the cache
+        return list(self._columns_list)
 
     def copy(self):
         """
@@ -523,7 +629,10 @@ class CatalogSourceBase(object):
         if self.base is not None: return self.base.get_hardcolumn(col)
 
         if col in self._hardcolumns:
-            return getattr(self, col)()
+            # O(1) lookup in the per-class registry built by ColumnFinder;
+            # this also handles columns registered under a name different
+            # from the name of the member function
+            return self._column_getters[col](self)
         else:
             raise ValueError("no such hard-coded column %s" %col)
 
@@ -548,11 +657,15 @@ class CatalogSourceBase(object):
 
         """
         import dask
+        from nbodykit import GlobalCache
 
         # return the base compute if it exists
         if self.base is not None:
             return self.base.compute(*args, **kwargs)
 
+        # ensure the opportunistic cache is registered (created lazily)
+        GlobalCache.get()
+
         toret = dask.compute(*args, **kwargs)
 
         # do not return tuples of length one
@@ -683,16 +796,23 @@ class CatalogSourceBase(object):
                             except:
                                 raise ValueError("cannot save '%s' key in attrs dictionary" % key)
 
+            # ensure the opportunistic cache is registered (created lazily),
+            # since the store call below does not go through self.compute()
+            from nbodykit import GlobalCache
+            GlobalCache.get()
+
             # lock=False to avoid dask from pickling the lock with the object.
             if compute:
-                # write blocks one by one
-                for column, source, target, region in zip(columns, sources, targets, regions):
-                    if self.comm.rank == 0:
-                        self.logger.info("started writing column %s" % column)
-                    source.store(target, regions=region, lock=False, compute=True)
+                # write all blocks with a single store call, so that tasks
+                # shared between columns are only executed once
+                if self.comm.rank == 0:
+                    self.logger.info("started writing columns %s" % str(columns))
+                if len(sources) > 0:
+                    da.store(sources, targets, regions=regions, lock=False, compute=True)
+                for target in targets:
                     target.bb.close()
-                    if self.comm.rank == 0:
-                        self.logger.info("finished writing column %s" % column)
+                if self.comm.rank == 0:
+                    self.logger.info("finished writing columns %s" % str(columns))
                 future = None
             else:
                 # return a future that writes all blocks at the same time.
@@ -716,7 +836,9 @@ class CatalogSourceBase(object):
         list of :class:`dask.array.Array` :
             the list of column data, in the form of dask arrays
         """
-        missing = set(columns) - set(self.columns)
+        # validate via __contains__, which checks the column registries
+        # directly rather than building the full sorted column list
+        missing = [col for col in columns if col not in self]
         if len(missing) > 0:
             msg = "source does not contain columns: %s; " %str(missing)
             msg += "try adding columns via `source[column] = data`"
@@ -724,6 +846,32 @@ class CatalogSourceBase(object):
 
         return [self[col] for col in columns]
 
+    def read_computed(self, columns):
+        """
+        Return the requested columns, computed to numpy arrays with a
+        single :func:`dask.compute` call.
+
+        Submitting all of the columns to the scheduler at once allows
+        dask to execute tasks that are shared between columns only once,
+        rather than re-computing them for each column.
+
+        Parameters
+        ----------
+        columns : list of str
+            the names of the requested columns
+
+        Returns
+        -------
+        list of :class:`numpy.ndarray` :
+            the list of column data, in the form of numpy arrays
+        """
+        toret = self.compute(*self.read(columns))
+
+        # compute() unpacks length-one tuples
+        if len(columns) == 1: toret = (toret,)
+
+        return list(toret)
+
     def view(self, type=None):
         """
         Return a "view" of the CatalogSource object, with the returned
@@ -957,10 +1105,13 @@ class CatalogSource(CatalogSourceBase):
         Add columns to the CatalogSource, overriding any existing columns
         with the name ``col``.
         """
-        # handle scalar values
-        if numpy.isscalar(value):
+        # handle scalar values; numpy.ndim also classifies 0-d arrays and
+        # numpy scalars as scalar, which numpy.isscalar does not
+        if numpy.ndim(value) == 0:
             assert self.size is not NotImplemented, "size is not implemented! cannot set scalar array"
-            value = ConstantArray(value, self.size, chunks=_global_options['dask_chunk_size'])
+            if not isinstance(value, da.Array):
+                value = numpy.asarray(value)
+            value = da.broadcast_to(value, (self.size,))
 
         # check the correct size, if we know the size
         if self.size is not NotImplemented:
@@ -981,6 +1132,13 @@ class CatalogSource(CatalogSourceBase):
 
         .. important::
             This property must be defined for all subclasses.
+
+        .. note::
+            ``size`` is always a concrete integer, never a delayed
+            quantity: it feeds the collective :attr:`csize` reduction and
+            the decomposition of painting and IO operations, which must
+            agree across all ranks. This is why selections evaluate their
+            index eagerly instead of staying fully lazy.
         """
         if self.base is not None: return self.base.size
 
@@ -1019,11 +1177,6 @@ class CatalogSource(CatalogSourceBase):
             After the global slice is performed, the data is scattered
             evenly across all ranks.
 
-        .. note::
-
-            The current algorithm generates an index on the root rank
-            and does not scale well.
-
         Parameters
         ----------
         start : int
@@ -1039,17 +1192,16 @@ class CatalogSource(CatalogSourceBase):
         """
         from nbodykit.utils import ScatterArray, GatherArray
 
-        # determine the boolean index corresponding to the slice
-        if self.comm.rank == 0:
-            index = numpy.zeros(self.csize, dtype=bool)
-            index[slice(start, stop, end)] = True
+        # each rank determines the part of the global boolean index that
+        # covers its local rows directly, rather than building the full
+        # index on the root rank and scattering it
+        start, stop, step = slice(start, stop, end).indices(self.csize)
+        offset = numpy.sum(self.comm.allgather(self.size)[:self.comm.rank], dtype='intp')
+        gidx = numpy.arange(offset, offset + self.size, dtype='intp')
+        if step > 0:
+            index = (gidx >= start) & (gidx < stop) & ((gidx - start) % step == 0)
         else:
-            index = None
-        index = self.comm.bcast(index)
-
-        # scatter the index back to all ranks
-        counts = self.comm.allgather(self.size)
-        index = ScatterArray(index, self.comm, root=0, counts=counts)
+            index = (gidx <= start) & (gidx > stop) & ((start - gidx) % -step == 0)
 
         # perform the needed local slice
         subset = self[index]
@@ -1082,6 +1234,8 @@ class CatalogSource(CatalogSourceBase):
         """
 
         import dask.array as da
+        from nbodykit import GlobalCache
+
         if columns is None:
             columns = self.columns
 
@@ -1089,6 +1243,10 @@ class CatalogSource(CatalogSourceBase):
         for key in columns:
             r[key] = self[key]
 
+        # ensure the opportunistic cache is registered (created lazily),
+        # since the compute call below does not go through self.compute()
+        GlobalCache.get()
+
         r = da.compute(r)[0] # particularity of dask
 
         from nbodykit.source.catalog.array import ArrayCatalog
@@ -1171,7 +1329,7 @@ class CatalogSource(CatalogSourceBase):
         By default, this column is set to ``True`` for all particles, and
         all CatalogSource objects will contain this column.
         """
-        return ConstantArray(True, self.size, chunks=_global_options['dask_chunk_size'])
+        return da.broadcast_to(numpy.asarray(True), (self.size,))
 
     @column(is_default=True)
     def Weight(self):
@@ -1184,7 +1342,7 @@ class CatalogSource(CatalogSourceBase):
         By default, this array is set to unity for all particles, and
         all CatalogSource objects will contain this column.
         """
-        return ConstantArray(1.0, self.size, chunks=_global_options['dask_chunk_size'])
+        return da.broadcast_to(numpy.asarray(1.0), (self.size,))
 
     @property
     def Index(self):
@@ -1198,7 +1356,7 @@ class CatalogSource(CatalogSourceBase):
         # do not use u8, because many numpy casting rules case u8 to f8 automatically.
         # it is ridiculous.
         return da.arange(offset, offset + self.size, dtype='i8',
-               chunks=_global_options['dask_chunk_size'])
+               chunks=_default_chunk_size(8))
 
     @column(is_default=True)
     def Value(self):
@@ -1213,7 +1371,7 @@ class CatalogSource(CatalogSourceBase):
         By default, this array is set to unity for all particles, and
         all CatalogSource objects will contain this column.
         """
-        return ConstantArray(1.0, self.size, chunks=_global_options['dask_chunk_size'])
+        return da.broadcast_to(numpy.asarray(1.0), (self.size,))
 
 
 def _sort_data(comm, cat, rankby, reverse=False, usecols=None):
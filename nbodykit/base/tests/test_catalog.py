@@ -283,6 +283,30 @@ def test_dask_slice(comm):
     pos2 = pos[source['Selection']]
     assert_array_equal(pos.compute()[index], pos2.compute())
 
+@MPITest([1, 4])
+def test_unknown_chunk_slice(comm):
+
+    source = UniformCatalog(nbar=2e-4, BoxSize=512., seed=42, comm=comm)
+
+    # a dask-level filter produces an array with unknown chunk sizes
+    x = source['Position'][:, 0]
+    mask = x[x >= 0] < 0.5 * source.attrs['BoxSize'][0]
+    assert numpy.isnan(mask.shape[0])
+
+    # slicing with the mask should not require computing the chunk sizes
+    subset = source[mask]
+
+    index = source.compute(mask)
+    assert subset.size == index.sum()
+    assert_array_equal(subset['Position'].compute(), source['Position'].compute()[index])
+
+    # a wrong-length mask is only detectable after computing; it should
+    # still be rejected
+    bad = x[x < 0.5 * source.attrs['BoxSize'][0]] < 100.
+    assert numpy.isnan(bad.shape[0])
+    with pytest.raises(KeyError):
+        subset = source[bad]
+
 @MPITest([1, 4])
 def test_index(comm):
 
@@ -333,6 +357,25 @@ def test_getitem_columns(comm):
     for col in subset:
         assert_array_equal(subset[col].compute(), source[col].compute())
 
+    # a numpy array of column names works like a list
+    subset = source[numpy.array(['Position', 'Velocity'])]
+
+    for col in ['Position', 'Velocity']:
+        assert_array_equal(subset[col].compute(), source[col].compute())
+
+@MPITest([1, 4])
+def test_setitem_scalar(comm):
+
+    source = UniformCatalog(nbar=2e-4, BoxSize=512., seed=42, comm=comm)
+
+    # python scalars, numpy scalars and 0-d arrays are all broadcast to
+    # a constant column of the right size
+    for value in [1.5, numpy.float64(2.5), numpy.asarray(3.5)]:
+        source['constant'] = value
+        col = source['constant']
+        assert len(col) == source.size
+        assert_array_equal(col.compute(), value)
+
 @MPITest([1, 4])
 def test_delitem(comm):
 
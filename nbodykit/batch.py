@@ -191,9 +191,9 @@ class TaskManager(object):
                 args = self.basecomm.recv(source=0, tag=MPI.ANY_TAG, status=self.status)
                 tag = self.status.Get_tag()
 
-            # bcast to everyone in the worker subcomm
-            args  = self.comm.bcast(args) # args is [task_number, task_value]
-            tag   = self.comm.bcast(tag)
+            # bcast to everyone in the worker subcomm, in a single collective
+            # args is [task_number, task_value]
+            args, tag = self.comm.bcast((args, tag))
 
             # yield the task
             if tag == self.tags.START:
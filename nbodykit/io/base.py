@@ -2,7 +2,7 @@ from six import string_types
 import numpy
 import logging
 from abc import abstractmethod
-from nbodykit import _global_options
+from nbodykit import _global_options, _default_chunk_size
 
 class FileType(object):
     """
@@ -372,14 +372,16 @@ class FileType(object):
             necessary functions to read the data, but delays evaluating
             until the user specifies
         """
-        if blocksize is None:
-            blocksize = _global_options['dask_chunk_size']
-
         if column not in self:
             raise ValueError("'%s' is not a valid column; run keys() for valid options" %column)
 
+        col = self[column]
+        if blocksize is None:
+            rowsize = col.dtype.itemsize * numpy.prod(col.shape[1:], dtype='intp')
+            blocksize = _default_chunk_size(rowsize)
+
         import dask.array as da
-        return da.from_array(self[column], chunks=blocksize)
+        return da.from_array(col, chunks=blocksize)
 
 
 def find_slice_chunks(index):
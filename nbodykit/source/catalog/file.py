@@ -127,6 +127,10 @@ class FileCatalogBase(CatalogSource):
             return CatalogSource.get_hardcolumn(self, col)
 
 
+# a single processor shared by all of the factory calls below; each call
+# to _make_docstring overwrites the 'test' sections before substituting
+_docstring_processor = docrep.DocstringProcessor()
+
 def _make_docstring(filetype, examples):
     """
     Internal function to generate the doc strings for the built-in
@@ -135,7 +139,7 @@ def _make_docstring(filetype, examples):
     """
 
     qualname = '%s.%s' %(filetype.__module__, filetype.__name__)
-    __doc__ = """
+    parts = ["""
 A CatalogSource that uses :class:`~{qualname}` to read data from disk.
 
 Multiple files can be read at once by supplying a list of file
@@ -150,19 +154,19 @@ comm : MPI Communicator, optional
     current communicator
 attrs : dict, optional
     dictionary of meta-data to store in :attr:`attrs`
-""".format(qualname=qualname)
+""".format(qualname=qualname)]
 
     if examples is not None:
-        __doc__ += """
+        parts.append("""
 Examples
 --------
 Please see :ref:`the documentation <%s>` for examples.
-""" %examples
+""" %examples)
 
     # get the Parameters from the IO libary class
-    d = docrep.DocstringProcessor()
+    d = _docstring_processor
     d.get_sections(d.dedents(filetype.__doc__), 'test', ['Parameters'])
-    return d.dedents(__doc__)
+    return d.dedents(''.join(parts))
 
 def FileCatalogFactory(name, filetype, examples=None):
     """
@@ -1,6 +1,6 @@
 from nbodykit.base.catalog import CatalogSource, column
 from nbodykit import cosmology
-from nbodykit.utils import attrs_to_dict
+from nbodykit.utils import attrs_to_dict, cast_vector
 from nbodykit import CurrentMPIComm
 
 import logging
@@ -130,8 +130,7 @@ class LogNormalCatalog(CatalogSource):
         from pmesh.pm import ParticleMesh
 
         # the particle mesh for gridding purposes
-        _Nmesh = numpy.empty(3, dtype='i8')
-        _Nmesh[:] = Nmesh
+        _Nmesh = cast_vector(Nmesh, dtype='i8')
         pm = ParticleMesh(BoxSize=BoxSize, Nmesh=_Nmesh, dtype='f4', comm=self.comm)
 
         # growth rate to do RSD in the Zel'dovich approx
@@ -52,13 +52,24 @@ class SubVolumesCatalog(CatalogSource):
         self._frozen = {}
         if columns is None: columns = source.columns
 
-        for column in columns:
-            data = source[column].compute()
-            self._frozen[column] = self.make_column(layout.exchange(data))
+        # compute all columns in a single pass, so that upstream tasks
+        # shared between columns are only executed once
+        data = source.read_computed(columns)
+
+        # pack the columns into a single structured array, so the domain
+        # exchange sends one message per rank instead of one per column
+        dtype = numpy.dtype([(col, (d.dtype, d.shape[1:])) for col, d in zip(columns, data)])
+        packed = numpy.empty(source.size, dtype=dtype)
+        for col, d in zip(columns, data):
+            packed[col][...] = d
+        packed = layout.exchange(packed)
+
+        for col in columns:
+            self._frozen[col] = self.make_column(packed[col])
 
     @property
     def hardcolumns(self):
-        return sorted(list(self._frozen.keys()))
+        return sorted(self._frozen)
 
     def get_hardcolumn(self, col):
         return self._frozen[col]
@@ -1,6 +1,7 @@
 from nbodykit.base.catalog import CatalogSource, column
 from nbodykit import CurrentMPIComm
 from nbodykit.mpirng import MPIRandomState
+from nbodykit.utils import cast_vector
 import numpy
 
 class RandomCatalog(CatalogSource):
@@ -87,9 +88,7 @@ class UniformCatalog(RandomCatalog):
 
         self.comm    = comm
 
-        _BoxSize = numpy.empty(3, dtype='f8')
-        _BoxSize[:] = BoxSize
-        self.attrs['BoxSize'] = _BoxSize
+        self.attrs['BoxSize'] = cast_vector(BoxSize)
 
         rng = numpy.random.RandomState(seed)
         N = rng.poisson(nbar * numpy.prod(self.attrs['BoxSize']))
@@ -91,9 +91,11 @@ class CatalogMesh(MeshSource):
         self.Value = Value
         self.Selection = Selection
 
-        self.attrs['interlaced'] = interlaced
-        self.attrs['compensated'] = compensated
-        self.attrs['resampler'] = str(resampler)
+        # initialize through the property setters, so the constructor and
+        # post-hoc assignment share the same validation
+        self.interlaced = interlaced
+        self.compensated = compensated
+        self.resampler = str(resampler)
 
     @property
     def interlaced(self):
@@ -186,6 +188,10 @@ class CatalogMesh(MeshSource):
         """
 
         pm = self.pm
+
+        # query the communicator once; the rank is used on every chunk below
+        is_root = pm.comm.rank == 0
+
         Nlocal = 0 # (unweighted) number of particles read on local rank
         Wlocal = 0 # (weighted) number of particles read on local rank
         W2local = 0 # sum of weight square. This is used to estimate shotnoise.
@@ -218,6 +224,19 @@ class CatalogMesh(MeshSource):
         Value = self.Value
         Selection = self.Selection
 
+        # default columns are known constants (Weight and Value are unity,
+        # Selection is all True), so short-circuit them to None rather than
+        # computing and exchanging arrays of constants
+        if getattr(Weight, 'is_default', False): Weight = None
+        if getattr(Value, 'is_default', False): Value = None
+        if getattr(Selection, 'is_default', False): Selection = None
+
+        # the selection mask is needed by every chunk of the paint loop
+        # below; at one byte per row it is cheap to hold in memory, so
+        # compute it once up front instead of once per chunk
+        if Selection is not None:
+            Selection = self.source.compute(Selection)
+
         # ensure the slices are synced, since decomposition is collective
         Nlocalmax = max(pm.comm.allgather(len(Position)))
 
@@ -231,8 +250,6 @@ class CatalogMesh(MeshSource):
         def dochunk(s):
             if len(Position) != 0:
 
-                # selection has to be computed many times when data is `large`.
-
                 columns = [Position[s]]
                 if Weight is not None:
                     columns.append(Weight[s])
@@ -255,16 +272,24 @@ class CatalogMesh(MeshSource):
                 weight = None
                 value = None
 
-            if weight is None:
-                weight = numpy.ones(len(position))
-
-            if value is None:
-                value = numpy.ones(len(position))
-
             # track total (selected) number and sum of weights
             Nlocal = len(position)
-            Wlocal = weight.sum()
-            W2local = (weight ** 2).sum()
+            if weight is not None:
+                Wlocal = weight.sum()
+                W2local = (weight ** 2).sum()
+            else:
+                Wlocal = float(Nlocal)
+                W2local = float(Nlocal)
+
+            # fuse weight and value into the mass that each particle
+            # deposits on the mesh, so a single array is exchanged and
+            # painted; None means every particle deposits unit mass
+            if weight is None:
+                mass = value
+            elif value is None:
+                mass = weight
+            else:
+                mass = weight * value
 
             # no interlacing
             if not self.interlaced:
@@ -275,16 +300,15 @@ class CatalogMesh(MeshSource):
             # if we are receiving too many particles, abort and retry with a smaller chunksize
             recvlengths = pm.comm.allgather(lay.recvlength)
             if any([recvlength > 2 * max_chunksize for recvlength in recvlengths]):
-                if pm.comm.rank == 0:
+                if is_root:
                     self.logger.info("Throttling chunksize as some ranks will receive too many particles. (%d > %d)" % (max(recvlengths), max_chunksize * 2))
                 raise StopIteration
 
             p = lay.exchange(position)
-            w = lay.exchange(weight)
-            v = lay.exchange(value)
+            m = 1.0 if mass is None else lay.exchange(mass)
 
             if not self.interlaced:
-                pm.paint(p, mass=w * v, resampler=resampler, hold=True, out=toret)
+                pm.paint(p, mass=m, resampler=resampler, hold=True, out=toret)
 
             # interlacing: use 2 meshes separated by 1/2 cell size
             else:
@@ -292,8 +316,8 @@ class CatalogMesh(MeshSource):
                 shifted = pm.affine.shift(0.5)
 
                 # paint to two shifted meshes
-                pm.paint(p, mass=w * v, resampler=resampler, hold=True, out=real1)
-                pm.paint(p, mass=w * v, resampler=resampler, transform=shifted, hold=True, out=real2)
+                pm.paint(p, mass=m, resampler=resampler, hold=True, out=real1)
+                pm.paint(p, mass=m, resampler=resampler, transform=shifted, hold=True, out=real2)
 
             return Nlocal, Wlocal, W2local
 
@@ -304,7 +328,7 @@ class CatalogMesh(MeshSource):
 
             s = slice(i, i + chunksize)
 
-            if pm.comm.rank == 0:
+            if is_root:
                 self.logger.info("Chunk %d ~ %d / %d " % (i, i + chunksize, Nlocalmax))
 
             try:
@@ -324,7 +348,7 @@ class CatalogMesh(MeshSource):
 
             Nglobal = pm.comm.allreduce(Nlocal)
 
-            if pm.comm.rank == 0:
+            if is_root:
                 self.logger.info("painted %d out of %d objects to mesh"
                     % (Nglobal, self.source.csize))
 
@@ -386,7 +410,7 @@ class CatalogMesh(MeshSource):
         toret.attrs['num_per_cell'] = nbar
 
         csum = toret.csum()
-        if pm.comm.rank == 0:
+        if is_root:
             self.logger.info("painted %d out of %d objects to mesh" %(N, self.source.csize))
             self.logger.info("mean particles per cell is %g", nbar)
             self.logger.info("sum is %g ", csum)
@@ -397,7 +421,7 @@ class CatalogMesh(MeshSource):
             else:
                 toret[...] = 1
 
-            if pm.comm.rank == 0:
+            if is_root:
                 self.logger.info("normalized the convention to 1 + delta")
 
         return toret
@@ -12,6 +12,28 @@ def test_cache_size():
         cache = GlobalCache.get()
         assert cache.cache.available_bytes == 100
 
+@MPITest([1])
+def test_dask_chunk_bytes(comm):
+    import numpy
+    from nbodykit import CurrentMPIComm
+    from nbodykit.lab import UniformCatalog
+
+    with CurrentMPIComm.enter(comm):
+        # Position rows are 3 'f8' values, so a 2400 byte target gives
+        # chunks of 100 rows
+        with set_options(dask_chunk_bytes=2400):
+            s = UniformCatalog(1000, 1.0)
+            assert s['Position'].chunks[0][0] == min(100, s.size)
+
+            # narrower rows pack more rows into a chunk of the same bytes
+            s['mass'] = numpy.ones(s.size, dtype='f4')
+            assert s['mass'].chunks[0][0] == min(600, s.size)
+
+        # an explicit dask_chunk_size overrides the byte target
+        with set_options(dask_chunk_size=75, dask_chunk_bytes=2400):
+            s = UniformCatalog(1000, 1.0)
+            assert s['Position'].chunks[0][0] == 75
+
 @MPITest([1, 4])
 def test_use_mpi(comm):
     use_mpi(comm)
@@ -106,6 +106,32 @@ def split_size_3d(s):
     c = s
     return a, b, c
 
+def cast_vector(value, ndim=3, dtype='f8'):
+    """
+    Cast a scalar or sequence to a numpy vector of length ``ndim``.
+
+    This normalizes ``BoxSize``- and ``Nmesh``-style arguments in a
+    single step: scalars are repeated ``ndim`` times and sequences must
+    broadcast to the requested length.
+
+    Parameters
+    ----------
+    value : float, array_like
+        the scalar or sequence to cast
+    ndim : int, optional
+        the length of the returned vector
+    dtype : str, optional
+        the data type of the returned vector
+
+    Returns
+    -------
+    :class:`numpy.ndarray` :
+        ``value``, broadcast to a vector of length ``ndim``
+    """
+    toret = numpy.empty(ndim, dtype=dtype)
+    toret[:] = value
+    return toret
+
 def deprecate(name, alternative, alt_name=None):
     """
     This is a decorator which can be used to mark functions
@@ -120,6 +146,24 @@ def deprecate(name, alternative, alt_name=None):
         return alternative(*args, **kwargs)
     return wrapper
 
+# committed byte-contiguous MPI datatypes, keyed by itemsize; these are
+# reused across GatherArray/ScatterArray calls instead of being created
+# and freed per call, since only a handful of itemsizes ever occur
+_contiguous_datatypes = {}
+
+def _get_contiguous_datatype(itemsize):
+    """
+    Return a committed ``MPI.BYTE.Create_contiguous(itemsize)`` datatype,
+    cached by ``itemsize``. The caller must not free the returned datatype.
+    """
+    try:
+        return _contiguous_datatypes[itemsize]
+    except KeyError:
+        dt = MPI.BYTE.Create_contiguous(itemsize)
+        dt.Commit()
+        _contiguous_datatypes[itemsize] = dt
+        return dt
+
 def GatherArray(data, comm, root=0):
     """
     Gather the input data array from all ranks to the specified ``root``.
@@ -150,9 +194,10 @@ def GatherArray(data, comm, root=0):
         data = numpy.ascontiguousarray(data)
     local_length = data.shape[0]
 
-    # check dtypes and shapes
-    shapes = comm.allgather(data.shape)
-    dtypes = comm.allgather(data.dtype)
+    # check dtypes and shapes, with a single collective call
+    shapes_and_dtypes = comm.allgather((data.shape, data.dtype))
+    shapes = [s for s, dt in shapes_and_dtypes]
+    dtypes = [dt for s, dt in shapes_and_dtypes]
 
     # check for structured data
     if dtypes[0].char == 'V':
@@ -166,8 +211,9 @@ def GatherArray(data, comm, root=0):
         if any(dtypes[0][name] == 'O' for name in dtypes[0].names):
             raise ValueError("object data types ('O') not allowed in structured data in GatherArray")
 
-        # compute the new shape for each rank
-        newlength = comm.allreduce(local_length)
+        # compute the new shape for each rank; the lengths are already
+        # known from the allgather above
+        newlength = sum(s[0] for s in shapes)
         newshape = list(data.shape)
         newshape[0] = newlength
 
@@ -208,11 +254,13 @@ def GatherArray(data, comm, root=0):
     # setup the custom dtype
     duplicity = numpy.product(numpy.array(shape[1:], 'intp'))
     itemsize = duplicity * dtype.itemsize
-    dt = MPI.BYTE.Create_contiguous(itemsize)
-    dt.Commit()
+    dt = _get_contiguous_datatype(itemsize)
+
+    # the recv counts, known from the allgather above
+    counts = numpy.array([s[0] for s in shapes], order='C')
 
     # compute the new shape for each rank
-    newlength = comm.allreduce(local_length)
+    newlength = counts.sum()
     newshape = list(shape)
     newshape[0] = newlength
 
@@ -222,10 +270,6 @@ def GatherArray(data, comm, root=0):
     else:
         recvbuffer = None
 
-    # the recv counts
-    counts = comm.allgather(local_length)
-    counts = numpy.array(counts, order='C')
-
     # the recv offsets
     offsets = numpy.zeros_like(counts, order='C')
     offsets[1:] = counts.cumsum()[:-1]
@@ -236,8 +280,6 @@ def GatherArray(data, comm, root=0):
     else:
         comm.Gatherv([data, dt], [recvbuffer, (counts, offsets), dt], root=root)
 
-    dt.Free()
-
     return recvbuffer
 
 def ScatterArray(data, comm, root=0, counts=None):
@@ -271,26 +313,24 @@ def ScatterArray(data, comm, root=0, counts=None):
         if len(counts) != comm.size:
             raise ValueError("counts array has wrong length!")
 
-    # check for bad input
+    # validate the input and share the shape/dtype of the data with a
+    # single broadcast from the root
     if comm.rank == root:
         bad_input = not isinstance(data, numpy.ndarray)
+        if not bad_input:
+            # need C-contiguous order
+            if not data.flags['C_CONTIGUOUS']:
+                data = numpy.ascontiguousarray(data)
+            info = (bad_input, data.shape, data.dtype)
+        else:
+            info = (bad_input, None, None)
     else:
-        bad_input = None
-    bad_input = comm.bcast(bad_input)
+        info = None
+
+    bad_input, shape, dtype = comm.bcast(info, root=root)
     if bad_input:
         raise ValueError("`data` must by numpy array on root in ScatterArray")
 
-    if comm.rank == 0:
-        # need C-contiguous order
-        if not data.flags['C_CONTIGUOUS']:
-            data = numpy.ascontiguousarray(data)
-        shape_and_dtype = (data.shape, data.dtype)
-    else:
-        shape_and_dtype = None
-
-    # each rank needs shape/dtype of input data
-    shape, dtype = comm.bcast(shape_and_dtype)
-
     # object dtype is not supported
     fail = False
     if dtype.char == 'V':
@@ -308,8 +348,7 @@ def ScatterArray(data, comm, root=0, counts=None):
     # setup the custom dtype
     duplicity = numpy.product(numpy.array(shape[1:], 'intp'))
     itemsize = duplicity * dtype.itemsize
-    dt = MPI.BYTE.Create_contiguous(itemsize)
-    dt.Commit()
+    dt = _get_contiguous_datatype(itemsize)
 
     # compute the new shape for each rank
     newshape = list(shape)
@@ -339,7 +378,6 @@ def ScatterArray(data, comm, root=0, counts=None):
     # do the scatter
     comm.Barrier()
     comm.Scatterv([data, (counts, offsets), dt], [recvbuffer, dt])
-    dt.Free()
     return recvbuffer
 
 def FrontPadArray(array, front, comm):